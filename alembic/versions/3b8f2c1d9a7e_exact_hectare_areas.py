@@ -0,0 +1,68 @@
+"""Store hectare areas as exact NUMERIC(12, 4)
+
+Revision ID: 3b8f2c1d9a7e
+Revises: e5cc618e385d
+Create Date: 2025-07-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8f2c1d9a7e'
+down_revision: Union[str, Sequence[str], None] = 'e5cc618e385d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AREA_COLUMNS = ('total_area_hectares', 'arable_area_hectares', 'vegetation_area_hectares')
+BATCH_SIZE = 10_000
+
+
+def _copy_areas(where: str) -> sa.TextClause:
+    assignments = ', '.join(f'{c}_exact = round({c}::numeric, 4)' for c in AREA_COLUMNS)
+    return sa.text(f'UPDATE producers SET {assignments} WHERE {where}')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in AREA_COLUMNS:
+        op.add_column('producers', sa.Column(f'{column}_exact', sa.Numeric(12, 4), nullable=True))
+
+    # Backfill em lotes por faixa de ID, com commit a cada lote, para não manter
+    # a tabela inteira bloqueada durante a migração.
+    conn = op.get_bind()
+    max_id = conn.execute(sa.text('SELECT coalesce(max(id), 0) FROM producers')).scalar()
+    with op.get_context().autocommit_block():
+        for start in range(0, max_id, BATCH_SIZE):
+            conn.execute(
+                _copy_areas('id > :start AND id <= :end'),
+                {'start': start, 'end': start + BATCH_SIZE},
+            )
+
+    # Linhas inseridas ou alteradas durante o backfill.
+    conn.execute(sa.text('LOCK TABLE producers IN SHARE ROW EXCLUSIVE MODE'))
+    conn.execute(
+        _copy_areas(' OR '.join(
+            f'{c}_exact IS DISTINCT FROM round({c}::numeric, 4)' for c in AREA_COLUMNS
+        ))
+    )
+
+    for column in AREA_COLUMNS:
+        op.drop_column('producers', column)
+        op.alter_column('producers', f'{column}_exact', new_column_name=column, nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in AREA_COLUMNS:
+        op.alter_column(
+            'producers',
+            column,
+            type_=sa.Float(),
+            existing_type=sa.Numeric(12, 4),
+            existing_nullable=False,
+            postgresql_using=f'{column}::double precision',
+        )
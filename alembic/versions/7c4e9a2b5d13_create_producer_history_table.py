@@ -0,0 +1,45 @@
+"""Create producer_history table
+
+Revision ID: 7c4e9a2b5d13
+Revises: 3b8f2c1d9a7e
+Create Date: 2025-07-22 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4e9a2b5d13'
+down_revision: Union[str, Sequence[str], None] = '3b8f2c1d9a7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('producer_history',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('producer_id', sa.Integer(), nullable=False),
+    sa.Column('action', sa.String(length=10), nullable=False),
+    sa.Column('field', sa.String(length=50), nullable=True),
+    sa.Column('old_value', sa.Text(), nullable=True),
+    sa.Column('new_value', sa.Text(), nullable=True),
+    sa.Column('changed_by', sa.String(length=255), nullable=True),
+    sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_producer_history_producer_id_changed_at',
+        'producer_history',
+        ['producer_id', 'changed_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_producer_history_producer_id_changed_at', table_name='producer_history')
+    op.drop_table('producer_history')
@@ -0,0 +1,178 @@
+"""Partition producers by state
+
+Revision ID: 9d1a6f3e8b42
+Revises: 7c4e9a2b5d13
+Create Date: 2025-07-25 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9d1a6f3e8b42'
+down_revision: Union[str, Sequence[str], None] = '7c4e9a2b5d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATES = (
+    'AC', 'AL', 'AP', 'AM', 'BA', 'CE', 'DF', 'ES', 'GO', 'MA', 'MT', 'MS', 'MG', 'PA',
+    'PB', 'PR', 'PE', 'PI', 'RJ', 'RN', 'RS', 'RO', 'RR', 'SC', 'SP', 'SE', 'TO',
+)
+COLUMN_NAMES = (
+    'id', 'cpf_cnpj', 'name', 'farm_name', 'city', 'state', 'total_area_hectares',
+    'arable_area_hectares', 'vegetation_area_hectares', 'planted_crops', 'created_at',
+    'updated_at', 'is_active',
+)
+COLUMNS = ', '.join(COLUMN_NAMES)
+BATCH_SIZE = 10_000
+
+
+def _producer_columns() -> list:
+    return [
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('producers_id_seq')"), nullable=False),
+        sa.Column('cpf_cnpj', sa.String(length=14), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('farm_name', sa.String(length=255), nullable=False),
+        sa.Column('city', sa.String(length=100), nullable=False),
+        sa.Column('state', sa.String(length=2), nullable=False),
+        sa.Column('total_area_hectares', sa.Numeric(12, 4), nullable=False),
+        sa.Column('arable_area_hectares', sa.Numeric(12, 4), nullable=False),
+        sa.Column('vegetation_area_hectares', sa.Numeric(12, 4), nullable=False),
+        sa.Column('planted_crops', sa.String(length=500), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+    ]
+
+
+def _swap_out_old_table(indexes: Sequence[str]) -> None:
+    # A tabela antiga é renomeada e seus índices removidos para liberar os nomes;
+    # a sequence de IDs é reaproveitada pela nova tabela.
+    op.execute('LOCK TABLE producers IN ACCESS EXCLUSIVE MODE')
+    op.rename_table('producers', 'producers_old')
+    op.execute('ALTER TABLE producers_old RENAME CONSTRAINT producers_pkey TO producers_old_pkey')
+    for index in indexes:
+        op.drop_index(index, table_name='producers_old')
+
+
+def _drop_old_table() -> None:
+    op.execute('ALTER SEQUENCE producers_id_seq OWNED BY producers.id')
+    op.drop_table('producers_old')
+
+
+def _row(alias: str) -> str:
+    return f"ROW({', '.join(f'{alias}.{column}' for column in COLUMN_NAMES)})"
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    A nova tabela particionada é montada ao lado da atual e preenchida em lotes por
+    faixa de ID, com commit a cada lote, enquanto a API segue lendo e gravando. Depois,
+    com escritas bloqueadas (SHARE ROW EXCLUSIVE; leituras continuam), as linhas
+    alteradas durante a cópia são reconciliadas e producer_documents é preenchida de
+    uma vez. O ACCESS EXCLUSIVE fica restrito à troca de nomes das tabelas. A janela
+    sem escritas cresce com o número de produtores: a reconciliação e o preenchimento
+    de producer_documents percorrem a tabela inteira.
+    """
+    op.create_table('producers_new',
+    *_producer_columns(),
+    sa.PrimaryKeyConstraint('id', 'state', name='producers_new_pkey'),
+    postgresql_partition_by='LIST (state)',
+    )
+    op.create_index('ix_producers_new_cpf_cnpj', 'producers_new', ['cpf_cnpj'], unique=False)
+    for state in STATES:
+        op.execute(
+            f"CREATE TABLE producers_{state.lower()} PARTITION OF producers_new "
+            f"FOR VALUES IN ('{state}')"
+        )
+    op.execute('CREATE TABLE producers_default PARTITION OF producers_new DEFAULT')
+
+    # Índices únicos em tabelas particionadas precisam incluir a chave de partição;
+    # a unicidade global de CPF/CNPJ fica em producer_documents, mantida por trigger.
+    op.create_table('producer_documents',
+    sa.Column('cpf_cnpj', sa.String(length=14), nullable=False),
+    sa.Column('producer_id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('cpf_cnpj')
+    )
+
+    conn = op.get_bind()
+    max_id = conn.execute(sa.text('SELECT coalesce(max(id), 0) FROM producers')).scalar()
+    with op.get_context().autocommit_block():
+        for start in range(0, max_id, BATCH_SIZE):
+            conn.execute(
+                sa.text(
+                    f'INSERT INTO producers_new ({COLUMNS}) SELECT {COLUMNS} FROM producers '
+                    'WHERE id > :start AND id <= :end'
+                ),
+                {'start': start, 'end': start + BATCH_SIZE},
+            )
+
+    # Linhas inseridas, alteradas ou removidas durante a cópia.
+    conn.execute(sa.text('LOCK TABLE producers IN SHARE ROW EXCLUSIVE MODE'))
+    conn.execute(sa.text(f"""
+        DELETE FROM producers_new n WHERE NOT EXISTS (
+            SELECT 1 FROM producers o
+            WHERE o.id = n.id AND {_row('o')} IS NOT DISTINCT FROM {_row('n')}
+        )
+    """))
+    conn.execute(sa.text(f"""
+        INSERT INTO producers_new ({COLUMNS}) SELECT {COLUMNS} FROM producers o
+        WHERE NOT EXISTS (SELECT 1 FROM producers_new n WHERE n.id = o.id)
+    """))
+
+    # Preenchida de uma vez, antes do trigger existir, em vez de uma linha por produtor.
+    op.execute(
+        'INSERT INTO producer_documents (cpf_cnpj, producer_id) '
+        'SELECT cpf_cnpj, id FROM producers_new'
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION producers_sync_document() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                DELETE FROM producer_documents WHERE cpf_cnpj = OLD.cpf_cnpj;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO producer_documents (cpf_cnpj, producer_id)
+                VALUES (NEW.cpf_cnpj, NEW.id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER producers_sync_document
+        AFTER INSERT OR DELETE OR UPDATE OF cpf_cnpj ON producers_new
+        FOR EACH ROW EXECUTE FUNCTION producers_sync_document()
+    """)
+
+    _swap_out_old_table(['ix_producers_id', 'ix_producers_cpf_cnpj'])
+    op.rename_table('producers_new', 'producers')
+    op.execute('ALTER TABLE producers RENAME CONSTRAINT producers_new_pkey TO producers_pkey')
+    op.execute('ALTER INDEX ix_producers_new_cpf_cnpj RENAME TO ix_producers_cpf_cnpj')
+    _drop_old_table()
+    op.execute('ANALYZE producers')
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Copia tudo em uma única instrução sob ACCESS EXCLUSIVE: a API fica indisponível
+    durante a cópia, proporcional ao número de produtores.
+    """
+    _swap_out_old_table(['ix_producers_cpf_cnpj'])
+
+    op.create_table('producers',
+    *_producer_columns(),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_producers_cpf_cnpj'), 'producers', ['cpf_cnpj'], unique=True)
+    op.create_index(op.f('ix_producers_id'), 'producers', ['id'], unique=False)
+
+    op.execute(f'INSERT INTO producers ({COLUMNS}) SELECT {COLUMNS} FROM producers_old')
+    _drop_old_table()
+    op.drop_table('producer_documents')
+    op.execute('DROP FUNCTION producers_sync_document()')
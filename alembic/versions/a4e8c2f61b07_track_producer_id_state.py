@@ -0,0 +1,69 @@
+"""Track producer id and state in producer_documents
+
+Revision ID: a4e8c2f61b07
+Revises: 9d1a6f3e8b42
+Create Date: 2025-07-26 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e8c2f61b07'
+down_revision: Union[str, Sequence[str], None] = '9d1a6f3e8b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SYNC_DOCUMENT_FUNCTION = """
+    CREATE OR REPLACE FUNCTION producers_sync_document() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            DELETE FROM producer_documents WHERE cpf_cnpj = OLD.cpf_cnpj;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO producer_documents ({columns})
+            VALUES ({values});
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def _replace_trigger(columns: str, values: str, update_of: str) -> None:
+    op.execute('DROP TRIGGER producers_sync_document ON producers')
+    op.execute(SYNC_DOCUMENT_FUNCTION.format(columns=columns, values=values))
+    op.execute(f"""
+        CREATE TRIGGER producers_sync_document
+        AFTER INSERT OR DELETE OR UPDATE OF {update_of} ON producers
+        FOR EACH ROW EXECUTE FUNCTION producers_sync_document()
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # IDs vêm da sequence, mas o PK (id, state) só garante unicidade por partição;
+    # producer_documents passa a garantir o ID único e a guardar a UF de cada ID.
+    op.add_column('producer_documents', sa.Column('state', sa.String(length=2), nullable=True))
+    _replace_trigger(
+        'cpf_cnpj, producer_id, state', 'NEW.cpf_cnpj, NEW.id, NEW.state', 'id, cpf_cnpj, state'
+    )
+    op.execute("""
+        UPDATE producer_documents d SET producer_id = p.id, state = p.state
+        FROM producers p
+        WHERE p.cpf_cnpj = d.cpf_cnpj AND d.state IS NULL
+    """)
+    op.alter_column('producer_documents', 'state', nullable=False)
+    op.create_unique_constraint(
+        'producer_documents_producer_id_key', 'producer_documents', ['producer_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('producer_documents_producer_id_key', 'producer_documents', type_='unique')
+    _replace_trigger('cpf_cnpj, producer_id', 'NEW.cpf_cnpj, NEW.id', 'cpf_cnpj')
+    op.drop_column('producer_documents', 'state')
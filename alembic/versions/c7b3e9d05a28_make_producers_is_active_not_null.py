@@ -0,0 +1,40 @@
+"""Make producers.is_active not null with a server default
+
+Revision ID: c7b3e9d05a28
+Revises: a4e8c2f61b07
+Create Date: 2025-07-27 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7b3e9d05a28'
+down_revision: Union[str, Sequence[str], None] = 'a4e8c2f61b07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Linhas carregadas por COPY sem a coluna ficaram com NULL.
+    op.execute('UPDATE producers SET is_active = true WHERE is_active IS NULL')
+    op.alter_column(
+        'producers', 'is_active',
+        existing_type=sa.Boolean(),
+        server_default=sa.true(),
+        nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'producers', 'is_active',
+        existing_type=sa.Boolean(),
+        server_default=None,
+        nullable=True,
+    )
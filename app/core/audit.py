@@ -0,0 +1,204 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.logger import logger
+from app.core.settings import settings
+from app.models.producer import ProducerHistory
+from app.schemas.producer import format_hectares
+
+HECTARE_FIELDS = frozenset({
+    "total_area_hectares",
+    "arable_area_hectares",
+    "vegetation_area_hectares",
+})
+
+
+def _as_text(field: str, value: Any) -> Optional[str]:
+    """Texto do valor no mesmo formato exposto pela API, ex: áreas como '3,5 ha'."""
+    if value is None:
+        return None
+    if field in HECTARE_FIELDS:
+        return format_hectares(value)
+    return str(value)
+
+
+def history_entries(
+    producer_id: int,
+    action: str,
+    changed_by: Optional[str] = None,
+    changes: Optional[Dict[str, Tuple[Any, Any]]] = None,
+) -> List[dict]:
+    """Monta as linhas de histórico; `changes` mapeia campo -> (valor antigo, novo)."""
+    base = {
+        "producer_id": producer_id,
+        "action": action,
+        "changed_by": changed_by,
+        "changed_at": datetime.now(timezone.utc),
+    }
+    if not changes:
+        return [{**base, "field": None, "old_value": None, "new_value": None}]
+    return [
+        {
+            **base,
+            "field": field,
+            "old_value": _as_text(field, old),
+            "new_value": _as_text(field, new),
+        }
+        for field, (old, new) in changes.items()
+    ]
+
+
+class AuditWriter:
+    """Grava o histórico de alterações em segundo plano (write-behind).
+
+    As entradas ficam em uma fila limitada e são inseridas em lotes por uma única
+    task. Com a fila cheia, `record` aguarda espaço (backpressure) em vez de descartar.
+    Um lote que falha é regravado com backoff exponencial até `max_retries` vezes.
+    `stop` grava o que estiver pendente antes de encerrar, aguardando até
+    `shutdown_timeout`; entradas que ainda assim não forem gravadas são registradas
+    integralmente no log.
+    """
+
+    def __init__(  # noqa: PLR0913 - parâmetros de ajuste, todos nomeados
+        self,
+        max_queue_size: int,
+        batch_size: int,
+        *,
+        max_retries: int = 5,
+        retry_delay: float = 0.5,
+        flush_timeout: float = 5.0,
+        shutdown_timeout: float = 30.0,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.flush_timeout = flush_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self._session_maker: Optional[async_sessionmaker] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight: List[dict] = []
+        self._processed: Optional[asyncio.Condition] = None
+        self._enqueued_count = 0
+        self._processed_count = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, session_maker: async_sessionmaker) -> None:
+        self._session_maker = session_maker
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._processed = asyncio.Condition()
+        self._enqueued_count = self._processed_count = 0
+        self._in_flight = []
+        self._task = asyncio.create_task(self._run())
+        logger.info("Audit writer started.")
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        await self._wait_processed(self._enqueued_count, self.shutdown_timeout)
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        unwritten = list(self._in_flight)
+        while not self._queue.empty():
+            unwritten.append(self._queue.get_nowait())
+        if unwritten:
+            logger.error(
+                f"Audit writer stopped with {len(unwritten)} unwritten entries; "
+                f"entries={unwritten}"
+            )
+        logger.info("Audit writer stopped.")
+
+    async def record(self, entries: List[dict]) -> None:
+        if not self.running:
+            logger.warning(f"Audit writer is not running; dropping {len(entries)} entries.")
+            return
+        for entry in entries:
+            await self._queue.put(entry)
+            self._enqueued_count += 1
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Aguarda a gravação das entradas enfileiradas até o momento da chamada.
+
+        Entradas registradas depois não prolongam a espera. Retorna False se o
+        tempo limite (padrão `flush_timeout`) esgotar antes disso.
+        """
+        if not self.running:
+            return True
+        timeout = self.flush_timeout if timeout is None else timeout
+        return await self._wait_processed(self._enqueued_count, timeout)
+
+    async def _wait_processed(self, target: int, timeout: float) -> bool:
+        try:
+            async with self._processed:
+                await asyncio.wait_for(
+                    self._processed.wait_for(lambda: self._processed_count >= target), timeout
+                )
+        except asyncio.TimeoutError:
+            logger.warning(f"Audit flush timed out after {timeout}s.")
+            return False
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self._in_flight = batch
+            try:
+                await self._write_with_retry(batch)
+                # Só limpa ao concluir: se `stop` cancelar a gravação, o lote é logado.
+                self._in_flight = []
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+                async with self._processed:
+                    self._processed_count += len(batch)
+                    self._processed.notify_all()
+
+    async def _write_with_retry(self, batch: List[dict]) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self._write(batch)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.exception(
+                        f"Giving up on {len(batch)} audit entries after "
+                        f"{attempt + 1} attempts: {e}; entries={batch}"
+                    )
+                    return
+                delay = self.retry_delay * 2**attempt
+                logger.warning(
+                    f"Failed to write {len(batch)} audit entries "
+                    f"(attempt {attempt + 1}), retrying in {delay}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+    async def _write(self, batch: List[dict]) -> None:
+        async with self._session_maker() as session:
+            await session.execute(insert(ProducerHistory), batch)
+            await session.commit()
+        logger.info(f"Wrote {len(batch)} audit entries.")
+
+
+audit_writer = AuditWriter(
+    max_queue_size=settings.AUDIT_QUEUE_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    max_retries=settings.AUDIT_MAX_RETRIES,
+    retry_delay=settings.AUDIT_RETRY_DELAY,
+    flush_timeout=settings.AUDIT_FLUSH_TIMEOUT,
+    shutdown_timeout=settings.AUDIT_SHUTDOWN_TIMEOUT,
+)
@@ -0,0 +1,218 @@
+import zlib
+from typing import Dict, Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependência opcional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dependência opcional
+    zstandard = None
+
+
+class GzipCompressor:
+    encoding = "gzip"
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    encoding = "br"
+
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    encoding = "zstd"
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+DEFAULT_LEVELS = {
+    GzipCompressor.encoding: 6,
+    BrotliCompressor.encoding: 4,
+    ZstdCompressor.encoding: 3,
+}
+
+
+def available_compressors() -> Dict[str, type]:
+    """Codificações suportadas, em ordem de preferência do servidor."""
+    compressors = {}
+    if zstandard is not None:
+        compressors[ZstdCompressor.encoding] = ZstdCompressor
+    if brotli is not None:
+        compressors[BrotliCompressor.encoding] = BrotliCompressor
+    compressors[GzipCompressor.encoding] = GzipCompressor
+    return compressors
+
+
+def select_encoding(accept_encoding: str, supported: Iterable[str]) -> Optional[str]:
+    """Escolhe a codificação de maior `q` aceita pelo cliente e suportada pelo servidor.
+
+    Em caso de empate vale a ordem de preferência de `supported`.
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """Compressão negociada via `Accept-Encoding` (zstd, br ou gzip).
+
+    Respostas menores que `minimum_size` e caminhos em `excluded_paths` são enviados
+    sem compressão. Respostas em streaming são comprimidas bloco a bloco, com flush a
+    cada bloco para que o cliente receba os dados sem esperar o fim da resposta.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        levels: Optional[Dict[str, int]] = None,
+        excluded_paths: Iterable[str] = (),
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.excluded_paths = frozenset(excluded_paths)
+        self.compressors = available_compressors()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = select_encoding(accept_encoding, self.compressors)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            self.app,
+            send,
+            compressor_class=self.compressors[encoding],
+            level=self.levels[encoding],
+            minimum_size=self.minimum_size,
+        )
+        await responder(scope, receive)
+
+
+class _CompressionResponder:
+    def __init__(
+        self,
+        app: ASGIApp,
+        send: Send,
+        compressor_class: type,
+        level: int,
+        minimum_size: int,
+    ) -> None:
+        self.app = app
+        self.send = send
+        self.compressor_class = compressor_class
+        self.level = level
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive) -> None:
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            self.passthrough = "content-encoding" in Headers(raw=message["headers"])
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None and not self.passthrough:
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+            else:
+                self.compressor = self.compressor_class(self.level)
+                headers = MutableHeaders(raw=self.start_message["headers"])
+                headers["content-encoding"] = self.compressor_class.encoding
+                headers.add_vary_header("Accept-Encoding")
+                if "content-length" in headers:
+                    del headers["content-length"]
+
+        if self.passthrough:
+            await self._send_start()
+            await self.send(message)
+            return
+
+        if more_body:
+            data = self.compressor.compress(body) + self.compressor.flush()
+        else:
+            data = self.compressor.compress(body) + self.compressor.finish()
+            if self.start_message is not None:
+                headers = MutableHeaders(raw=self.start_message["headers"])
+                headers["content-length"] = str(len(data))
+        await self._send_start()
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    async def _send_start(self) -> None:
+        if self.start_message is not None:
+            message, self.start_message = self.start_message, None
+            await self.send(message)
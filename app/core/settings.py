@@ -14,5 +14,17 @@ class Settings(BaseSettings):
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
 
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    AUDIT_QUEUE_SIZE: int = 10_000
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_MAX_RETRIES: int = 5
+    AUDIT_RETRY_DELAY: float = 0.5
+    AUDIT_FLUSH_TIMEOUT: float = 5.0
+    AUDIT_SHUTDOWN_TIMEOUT: float = 30.0
+
 
 settings = Settings()
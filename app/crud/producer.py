@@ -1,13 +1,14 @@
-from typing import List
+from typing import List, Optional, Sequence
 
 from fastapi import HTTPException, status
 from fastapi.responses import JSONResponse
-from sqlalchemy import select
+from sqlalchemy import RowMapping, and_, bindparam, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
+from app.core.audit import audit_writer, history_entries
 from app.core.logger import logger
-from app.models.producer import Producer
+from app.models.producer import Producer, ProducerDocument, ProducerHistory
 from app.schemas.producer import ProducerCreate, ProducerUpdate
 
 
@@ -29,23 +30,111 @@ async def create_producer(db: AsyncSession, producer: ProducerCreate) -> Produce
     return db_producer
 
 
+producers_table = Producer.__table__
+documents_table = ProducerDocument.__table__
+
+
+def _by_id(producer_id):
+    """Filtro por ID que também fixa a UF, resolvida em `producer_documents`.
+
+    A UF vem de uma subconsulta, então o Postgres poda as partições em tempo de execução
+    e consulta apenas a do produtor, em vez de sondar o índice de cada partição.
+    """
+    state = (
+        select(documents_table.c.state)
+        .where(documents_table.c.producer_id == producer_id)
+        .scalar_subquery()
+    )
+    return and_(producers_table.c.id == producer_id, producers_table.c.state == state)
+
+
+PRODUCER_BY_ID = select(producers_table).where(_by_id(bindparam("producer_id")))
+
+
+def _select_producers(fields: Optional[Sequence[str]] = None):
+    if not fields:
+        return select(Producer)
+    return select(*(getattr(Producer, field) for field in fields))
+
+
 async def get_producer(db: AsyncSession, producer_id: int) -> Producer:
     logger.info(f"Fetching producer with ID: {producer_id}")
-    result = await db.execute(select(Producer).filter(Producer.id == producer_id))
+    result = await db.execute(select(Producer).filter(_by_id(producer_id)))
     producer = result.scalar_one_or_none()
     if not producer:
         logger.warning(f"Producer ID {producer_id} not found in get_producer.")
     return producer
 
 
-async def get_producers(db: AsyncSession, skip: int = 0, limit: int = 10) -> List[Producer]:
-    logger.info(f"Fetching producers: skip={skip}, limit={limit}")
-    result = await db.execute(select(Producer).offset(skip).limit(limit))
-    return result.scalars().all()
+def list_producers_query(
+    skip: int = 0,
+    limit: int = 10,
+    fields: Optional[Sequence[str]] = None,
+    state: Optional[str] = None,
+):
+    query = _select_producers(fields)
+    if state:
+        # Filtrar pela chave de partição permite ao Postgres ler apenas a partição da UF.
+        query = query.filter(Producer.state == state.upper())
+    return query.order_by(Producer.id).offset(skip).limit(limit)
+
+
+async def get_producer_row(
+    conn: AsyncConnection, producer_id: int, fields: Optional[Sequence[str]] = None
+) -> Optional[RowMapping]:
+    """Busca um produtor pelo ID via Core, sem sessão, identity map nem instrumentação ORM.
+
+    A instrução é montada uma única vez, então o SQLAlchemy reaproveita a compilação em
+    cache e o psycopg passa a usar um prepared statement após execuções repetidas na
+    mesma conexão do pool.
+    """
+    query = PRODUCER_BY_ID
+    if fields:
+        query = select(*(producers_table.c[field] for field in fields)).where(
+            _by_id(bindparam("producer_id"))
+        )
+    result = await conn.execute(query, {"producer_id": producer_id})
+    return result.mappings().one_or_none()
+
+
+async def get_producers(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 10,
+    fields: Optional[Sequence[str]] = None,
+    state: Optional[str] = None,
+) -> List[Producer]:
+    logger.info(f"Fetching producers: skip={skip}, limit={limit}, state={state}")
+    result = await db.execute(list_producers_query(skip, limit, fields, state))
+    return result.mappings().all() if fields else result.scalars().all()
+
+
+async def get_producers_by_ids(
+    db: AsyncSession, producer_ids: Sequence[int], fields: Optional[Sequence[str]] = None
+) -> List[Producer]:
+    logger.info(f"Fetching {len(producer_ids)} producers by ID")
+    # O join com producer_documents traz a UF de cada ID na mesma consulta; cada busca
+    # em `producers` é podada para a partição do produtor.
+    result = await db.execute(
+        _select_producers(fields)
+        .join(
+            ProducerDocument,
+            and_(
+                ProducerDocument.producer_id == Producer.id,
+                ProducerDocument.state == Producer.state,
+            ),
+        )
+        .filter(ProducerDocument.producer_id.in_(producer_ids))
+        .order_by(Producer.id)
+    )
+    return result.mappings().all() if fields else result.scalars().all()
 
 
 async def update_producer(
-    db: AsyncSession, producer_id: int, updates: ProducerUpdate
+    db: AsyncSession,
+    producer_id: int,
+    updates: ProducerUpdate,
+    changed_by: Optional[str] = None,
 ) -> Producer:
     logger.info(f"Updating producer ID: {producer_id}")
     db_producer = await get_producer(db, producer_id)
@@ -55,16 +144,24 @@ async def update_producer(
             status_code=status.HTTP_404_NOT_FOUND, detail="Producer not found."
         )
 
+    changes = {}
     for key, value in updates.model_dump(exclude_unset=True).items():
+        old_value = getattr(db_producer, key)
+        if old_value != value:
+            changes[key] = (old_value, value)
         setattr(db_producer, key, value)
 
     await db.commit()
     await db.refresh(db_producer)
     logger.info(f"Producer ID {producer_id} updated successfully.")
+    if changes:
+        await audit_writer.record(history_entries(producer_id, "update", changed_by, changes))
     return db_producer
 
 
-async def delete_producer(db: AsyncSession, producer_id: int) -> JSONResponse:
+async def delete_producer(
+    db: AsyncSession, producer_id: int, changed_by: Optional[str] = None
+) -> JSONResponse:
     logger.info(f"Deleting producer ID: {producer_id}")
     db_producer = await get_producer(db, producer_id)
     if not db_producer:
@@ -76,7 +173,23 @@ async def delete_producer(db: AsyncSession, producer_id: int) -> JSONResponse:
     await db.delete(db_producer)
     await db.commit()
     logger.info(f"Producer ID {producer_id} deleted successfully.")
+    await audit_writer.record(history_entries(producer_id, "delete", changed_by))
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content={"message": f"Producer with ID {producer_id} deleted successfully."},
     )
+
+
+async def get_producer_history(
+    db: AsyncSession, producer_id: int, skip: int = 0, limit: int = 50
+) -> List[ProducerHistory]:
+    logger.info(f"Fetching history for producer ID: {producer_id}")
+    await audit_writer.flush()
+    result = await db.execute(
+        select(ProducerHistory)
+        .filter(ProducerHistory.producer_id == producer_id)
+        .order_by(ProducerHistory.changed_at, ProducerHistory.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    return result.scalars().all()
@@ -11,3 +11,8 @@ Base = declarative_base()
 async def get_session():
     async with async_session_maker() as session:
         yield session
+
+
+async def get_connection():
+    async with engine.connect() as conn:
+        yield conn
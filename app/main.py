@@ -1,17 +1,43 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from app.core.audit import audit_writer
+from app.core.compression import CompressionMiddleware
 from app.core.logger import logger
+from app.core.settings import settings
+from app.database import async_session_maker
 from app.routers import producer
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    audit_writer.start(async_session_maker)
+    yield
+    await audit_writer.stop()
+
+
 app = FastAPI(
     title="Rural Producer API",
     description="API para gerenciamento de produtores rurais",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.include_router(producer.router, prefix="/api/v1")
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    levels={
+        "gzip": settings.COMPRESSION_GZIP_LEVEL,
+        "br": settings.COMPRESSION_BROTLI_QUALITY,
+        "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+    },
+    excluded_paths=("/health",),
+)
+
 
 @app.get("/")
 def read_root() -> dict:
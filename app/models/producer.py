@@ -1,25 +1,118 @@
-from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    event,
+    true,
+)
 from sqlalchemy.sql import func
 
 from app.database import Base
 
+STATES = (
+    "AC", "AL", "AP", "AM", "BA", "CE", "DF", "ES", "GO", "MA", "MT", "MS", "MG", "PA",
+    "PB", "PR", "PE", "PI", "RJ", "RN", "RS", "RO", "RR", "SC", "SP", "SE", "TO",
+)  # fmt: skip
+
 
 class Producer(Base):
+    """Tabela particionada por lista em `state`, uma partição por UF e uma default.
+
+    Índices únicos em tabelas particionadas precisam conter a chave de partição, então
+    a unicidade global de CPF/CNPJ e de ID é garantida por `producer_documents`, mantida
+    por trigger. Essa tabela também guarda a UF de cada ID, usada nas buscas por ID para
+    que o Postgres leia apenas a partição do produtor.
+    """
+
     __tablename__ = "producers"
+    __table_args__ = {"postgresql_partition_by": "LIST (state)"}
 
-    id = Column(Integer, primary_key=True, index=True)
-    cpf_cnpj = Column(String(14), unique=True, index=True, nullable=False)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    cpf_cnpj = Column(String(14), index=True, nullable=False)
     name = Column(String(255), nullable=False)
     farm_name = Column(String(255), nullable=False)
     city = Column(String(100), nullable=False)
-    state = Column(String(2), nullable=False)
-    total_area_hectares = Column(Float, nullable=False)
-    arable_area_hectares = Column(Float, nullable=False)
-    vegetation_area_hectares = Column(Float, nullable=False)
+    state = Column(String(2), primary_key=True)
+    total_area_hectares = Column(Numeric(12, 4), nullable=False)
+    arable_area_hectares = Column(Numeric(12, 4), nullable=False)
+    vegetation_area_hectares = Column(Numeric(12, 4), nullable=False)
     planted_crops = Column(String(500))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, nullable=False, default=True, server_default=true())
 
     def __repr__(self):
         return f"<Producer(id={self.id}, name='{self.name}', farm_name='{self.farm_name}')>"
+
+
+class ProducerDocument(Base):
+    __tablename__ = "producer_documents"
+
+    cpf_cnpj = Column(String(14), primary_key=True)
+    producer_id = Column(Integer, nullable=False, unique=True)
+    state = Column(String(2), nullable=False)
+
+
+PRODUCER_PARTITIONS_DDL = [
+    *(
+        f"CREATE TABLE producers_{state.lower()} PARTITION OF producers "
+        f"FOR VALUES IN ('{state}')"
+        for state in STATES
+    ),
+    "CREATE TABLE producers_default PARTITION OF producers DEFAULT",
+]
+
+PRODUCER_DOCUMENT_TRIGGER_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION producers_sync_document() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            DELETE FROM producer_documents WHERE cpf_cnpj = OLD.cpf_cnpj;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO producer_documents (cpf_cnpj, producer_id, state)
+            VALUES (NEW.cpf_cnpj, NEW.id, NEW.state);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER producers_sync_document
+    AFTER INSERT OR DELETE OR UPDATE OF id, cpf_cnpj, state ON producers
+    FOR EACH ROW EXECUTE FUNCTION producers_sync_document()
+    """,
+]
+
+for statement in PRODUCER_PARTITIONS_DDL + PRODUCER_DOCUMENT_TRIGGER_DDL:
+    event.listen(
+        Producer.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql")
+    )
+
+
+class ProducerHistory(Base):
+    __tablename__ = "producer_history"
+    __table_args__ = (
+        Index("ix_producer_history_producer_id_changed_at", "producer_id", "changed_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    producer_id = Column(Integer, nullable=False)
+    action = Column(String(10), nullable=False)
+    field = Column(String(50))
+    old_value = Column(Text)
+    new_value = Column(Text)
+    changed_by = Column(String(255))
+    changed_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<ProducerHistory(producer_id={self.producer_id}, action='{self.action}', "
+            f"field='{self.field}')>"
+        )
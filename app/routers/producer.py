@@ -1,15 +1,56 @@
-from typing import Annotated
+from typing import Annotated, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from app.core.logger import logger
 from app.crud import producer as crud
-from app.database import get_session
-from app.schemas.producer import ProducerCreate, ProducerList, ProducerResponse, ProducerUpdate
+from app.database import get_connection, get_session
+from app.schemas.producer import (
+    ProducerBatch,
+    ProducerBatchGet,
+    ProducerCreate,
+    ProducerHistoryResponse,
+    ProducerList,
+    ProducerPartialBatch,
+    ProducerPartialList,
+    ProducerPartialResponse,
+    ProducerResponse,
+    ProducerUpdate,
+    dump_producer_fields,
+    parse_fields,
+    producer_json,
+)
 
 router = APIRouter(prefix="/producers", tags=["producers"])
 
+FieldsQuery = Annotated[
+    Optional[str],
+    Query(
+        description=(
+            "Campos a retornar separados por vírgula, ex: 'name,state'. Quando informado, "
+            "cada produtor contém apenas `id` e os campos pedidos."
+        )
+    ),
+]
+ChangedByHeader = Annotated[
+    Optional[str],
+    Header(
+        alias="X-User",
+        max_length=255,
+        description="Usuário responsável pela alteração (auditoria)",
+    ),
+]
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        logger.warning(f"Invalid fields requested: {fields}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_producer(
@@ -30,18 +71,47 @@ async def create_producer(
     return created
 
 
+@router.post("/batch-get")
+async def read_producers_batch(
+    batch: ProducerBatchGet,
+    db: Annotated[AsyncSession, Depends(get_session)],
+    fields: FieldsQuery = None,
+) -> Union[ProducerBatch, ProducerPartialBatch]:
+    """
+    Retorna vários produtores pelos IDs em uma única consulta.
+    IDs inexistentes são listados em `missing_ids`.
+    """
+    selected = _parse_fields(fields)
+    logger.info(f"Request to batch get {len(batch.ids)} producers")
+    producers = await crud.get_producers_by_ids(db, producer_ids=batch.ids, fields=selected)
+    found = {producer["id"] if selected else producer.id for producer in producers}
+    missing_ids = [
+        producer_id for producer_id in dict.fromkeys(batch.ids) if producer_id not in found
+    ]
+    if selected:
+        return JSONResponse(
+            content={
+                "producers": [dump_producer_fields(row, selected) for row in producers],
+                "missing_ids": missing_ids,
+            }
+        )
+    return ProducerBatch(producers=producers, missing_ids=missing_ids)
+
+
 @router.get("/{producer_id}")
 async def read_producer(
     producer_id: int,
-    db: Annotated[AsyncSession, Depends(get_session)],
-) -> ProducerResponse:
+    conn: Annotated[AsyncConnection, Depends(get_connection)],
+    fields: FieldsQuery = None,
+) -> Union[ProducerResponse, ProducerPartialResponse]:
     """Retorna os dados de um produtor pelo ID"""
-    db_producer = await crud.get_producer(db, producer_id=producer_id)
-    if db_producer is None:
+    selected = _parse_fields(fields)
+    row = await crud.get_producer_row(conn, producer_id=producer_id, fields=selected)
+    if row is None:
         logger.warning(f"Producer ID {producer_id} not found.")
         raise HTTPException(status_code=404, detail="Producer not found")
-    logger.info(f"Producer found: {db_producer.name}")
-    return db_producer
+    logger.info(f"Producer found: {producer_id}")
+    return Response(content=producer_json(row, selected), media_type="application/json")
 
 
 @router.get("/")
@@ -49,12 +119,28 @@ async def read_producers(
     db: Annotated[AsyncSession, Depends(get_session)],
     skip: int = 0,
     limit: int = 10,
-) -> ProducerList:
+    fields: FieldsQuery = None,
+    state: Annotated[Optional[str], Query(min_length=2, max_length=2)] = None,
+) -> Union[ProducerList, ProducerPartialList]:
     """
     Retorna lista paginada de produtores cadastrados.
+    Use `fields` para retornar apenas as colunas necessárias e `state` para filtrar
+    pela UF (consulta apenas a partição do estado).
     """
-    logger.info(f"Request to list producers: skip={skip}, limit={limit}")
-    producers = await crud.get_producers(db, skip=skip, limit=limit)
+    selected = _parse_fields(fields)
+    logger.info(f"Request to list producers: skip={skip}, limit={limit}, state={state}")
+    producers = await crud.get_producers(
+        db, skip=skip, limit=limit, fields=selected, state=state
+    )
+    if selected:
+        return JSONResponse(
+            content={
+                "producers": [dump_producer_fields(row, selected) for row in producers],
+                "total": len(producers),
+                "page": skip,
+                "size": limit,
+            }
+        )
     return ProducerList(producers=producers, total=len(producers), page=skip, size=limit)
 
 
@@ -63,6 +149,7 @@ async def update_producer(
     producer_id: int,
     updates: ProducerUpdate,
     db: Annotated[AsyncSession, Depends(get_session)],
+    changed_by: ChangedByHeader = None,
 ) -> ProducerResponse:
     """
     Atualiza os dados do produtor pelo ID.
@@ -70,14 +157,32 @@ async def update_producer(
     Usar ponto em vez de virgula nos campos de hectares para valores decimais.
     """
     logger.info(f"Request to update producer ID: {producer_id}")
-    return await crud.update_producer(db=db, producer_id=producer_id, updates=updates)
+    return await crud.update_producer(
+        db=db, producer_id=producer_id, updates=updates, changed_by=changed_by
+    )
 
 
 @router.delete("/{producer_id}")
 async def delete_producer(
     producer_id: int,
     db: Annotated[AsyncSession, Depends(get_session)],
+    changed_by: ChangedByHeader = None,
 ) -> ProducerResponse:
     """Deleta um produtor existente passando o ID."""
     logger.info(f"Request to delete producer ID: {producer_id}")
-    return await crud.delete_producer(db=db, producer_id=producer_id)
+    return await crud.delete_producer(db=db, producer_id=producer_id, changed_by=changed_by)
+
+
+@router.get("/{producer_id}/history")
+async def read_producer_history(
+    producer_id: int,
+    db: Annotated[AsyncSession, Depends(get_session)],
+    skip: int = 0,
+    limit: int = 50,
+) -> List[ProducerHistoryResponse]:
+    """
+    Retorna o histórico de alterações do produtor (quem alterou, qual campo e quando).
+    O histórico é mantido mesmo após a exclusão do produtor.
+    """
+    logger.info(f"Request to list history of producer ID: {producer_id}")
+    return await crud.get_producer_history(db, producer_id=producer_id, skip=skip, limit=limit)
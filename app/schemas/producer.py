@@ -1,6 +1,7 @@
 import re
 from datetime import datetime
-from typing import List, Optional, Union
+from decimal import Decimal, InvalidOperation
+from typing import Any, List, Mapping, Optional, Sequence, Union
 
 from pydantic import (
     BaseModel,
@@ -10,6 +11,40 @@ from pydantic import (
     model_validator,
 )
 
+HECTARES_QUANTUM = Decimal("0.0001")
+# NUMERIC(12, 4) comporta até 8 dígitos inteiros
+HECTARES_LIMIT = Decimal(10) ** 8
+
+
+def parse_hectares(v: Union[Decimal, float, str]) -> Decimal:
+    """Converte '3,5 ha', '3.5' ou 3.5 em Decimal exato com 4 casas (1 m²)."""
+    if isinstance(v, str):
+        v = v.strip().lower()
+        if v.endswith("ha"):
+            v = v[:-2].strip()
+        v = v.replace(",", ".")
+    try:
+        value = Decimal(str(v))
+    except InvalidOperation:
+        raise ValueError(f"Valor inválido para hectares: {v}")
+    if not value.is_finite():
+        raise ValueError(f"Valor inválido para hectares: {v}")
+    if abs(value) >= HECTARES_LIMIT:
+        raise ValueError("Área deve ser menor que 100.000.000 ha")
+    try:
+        # Somar zero normaliza o zero negativo ('-0 ha' -> Decimal('0.0000')).
+        return value.quantize(HECTARES_QUANTUM) + 0
+    except InvalidOperation:
+        raise ValueError(f"Valor inválido para hectares: {v}")
+
+
+def format_hectares(v: Decimal) -> str:
+    """Formata hectares no padrão da API, ex: Decimal('3.5000') -> '3,5 ha'."""
+    text = f"{Decimal(v).normalize():f}"
+    if "." not in text:
+        text += ".0"
+    return f"{text.replace('.', ',')} ha"
+
 
 class ProducerBase(BaseModel):
     cpf_cnpj: str = Field(..., description="CPF ou CNPJ do produtor")
@@ -45,18 +80,12 @@ class ProducerBase(BaseModel):
 
     @field_validator("total_area_hectares", "arable_area_hectares", "vegetation_area_hectares")
     @classmethod
-    def validate_hectares(cls, v: Union[float, str], info) -> float:
-        """Converte valores de hectares de string ou float para float."""
-        if isinstance(v, str):
-            v = v.strip().lower()
-            if v.endswith("ha"):
-                v = v[:-2].strip().replace(",", ".")  # <- Ajuste feito aqui
-            try:
-                value = float(v)
-            except ValueError:
-                raise ValueError(f"Valor inválido para hectares: {v}. Use o formato '3,9 ha'")
-        else:
-            value = float(v)
+    def validate_hectares(cls, v: Union[float, str], info) -> Decimal:
+        """Converte valores de hectares de string ou float para Decimal."""
+        try:
+            value = parse_hectares(v)
+        except ValueError as e:
+            raise ValueError(f"{e}. Use o formato '3,9 ha'")
 
         if value < 0:
             raise ValueError("Área não pode ser negativa")
@@ -103,21 +132,14 @@ class ProducerUpdate(BaseModel):
 
     @field_validator("total_area_hectares", "arable_area_hectares", "vegetation_area_hectares")
     @classmethod
-    def validate_hectares_update(cls, v: Optional[Union[float, str]], info) -> Optional[float]:
+    def validate_hectares_update(
+        cls, v: Optional[Union[float, str]], info
+    ) -> Optional[Decimal]:
         """Converte valores de hectares para updates."""
         if v is None:
             return None
 
-        if isinstance(v, str):
-            v = v.strip().lower()
-            if v.endswith("ha"):
-                v = v[:-2].strip().replace(",", ".")  # <- Ajuste feito aqui
-            try:
-                value = float(v)
-            except ValueError:
-                raise ValueError(f"Valor inválido para hectares: {v}")
-        else:
-            value = float(v)
+        value = parse_hectares(v)
 
         if value < 0:
             raise ValueError("Área não pode ser negativa")
@@ -133,9 +155,9 @@ class ProducerInDB(BaseModel):
     farm_name: str
     city: str
     state: str
-    total_area_hectares: float
-    arable_area_hectares: float
-    vegetation_area_hectares: float
+    total_area_hectares: Decimal
+    arable_area_hectares: Decimal
+    vegetation_area_hectares: Decimal
     planted_crops: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -150,8 +172,22 @@ class ProducerResponse(ProducerInDB):
         "total_area_hectares", "arable_area_hectares", "vegetation_area_hectares"
     )
     @staticmethod
-    def serialize_hectares(v: float, _info) -> str:
-        return f"{str(v).replace('.', ',')} ha"
+    def serialize_hectares(v: Decimal, _info) -> str:
+        return format_hectares(v)
+
+
+class ProducerHistoryResponse(BaseModel):
+    id: int
+    producer_id: int
+    action: str
+    field: Optional[str] = None
+    old_value: Optional[str] = None
+    new_value: Optional[str] = None
+    changed_by: Optional[str] = None
+    changed_at: datetime
+
+    class Config:
+        from_attributes = True
 
 
 class ProducerList(BaseModel):
@@ -159,3 +195,72 @@ class ProducerList(BaseModel):
     total: int
     page: int
     size: int
+
+
+class ProducerPartialResponse(BaseModel):
+    """Resposta quando `fields` é informado: apenas `id` e os campos pedidos são enviados."""
+
+    id: int
+    cpf_cnpj: Optional[str] = None
+    name: Optional[str] = None
+    farm_name: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    total_area_hectares: Optional[str] = Field(None, example="3,5 ha")
+    arable_area_hectares: Optional[str] = Field(None, example="1,7 ha")
+    vegetation_area_hectares: Optional[str] = Field(None, example="1,0 ha")
+    planted_crops: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    is_active: Optional[bool] = None
+
+
+class ProducerPartialList(BaseModel):
+    producers: List[ProducerPartialResponse]
+    total: int
+    page: int
+    size: int
+
+
+class ProducerBatchGet(BaseModel):
+    ids: List[int] = Field(
+        ..., min_length=1, max_length=500, description="IDs dos produtores a buscar"
+    )
+
+
+class ProducerBatch(BaseModel):
+    producers: List[ProducerResponse]
+    missing_ids: List[int]
+
+
+class ProducerPartialBatch(BaseModel):
+    producers: List[ProducerPartialResponse]
+    missing_ids: List[int]
+
+
+PRODUCER_FIELDS = tuple(ProducerResponse.model_fields)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Converte o parâmetro `fields` (separado por vírgula) em lista de colunas.
+
+    O `id` é sempre incluído para que o cliente consiga relacionar os registros.
+    """
+    if not fields:
+        return None
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    invalid = [f for f in requested if f not in PRODUCER_FIELDS]
+    if invalid:
+        raise ValueError(f"Campos inválidos: {', '.join(invalid)}")
+    return ["id", *(f for f in dict.fromkeys(requested) if f != "id")]
+
+
+def producer_json(row: Mapping[str, Any], fields: Optional[Sequence[str]] = None) -> str:
+    """Serializa uma linha do banco direto no JSON de ProducerResponse, sem validação."""
+    include = set(fields) if fields else None
+    return ProducerResponse.model_construct(**row).model_dump_json(include=include)
+
+
+def dump_producer_fields(row: Mapping[str, Any], fields: Sequence[str]) -> dict:
+    """Serializa apenas os campos projetados, aplicando os mesmos serializers da resposta."""
+    return ProducerResponse.model_construct(**row).model_dump(mode="json", include=set(fields))
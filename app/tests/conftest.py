@@ -4,7 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from testcontainers.postgres import PostgresContainer
 
-from app.database import Base, get_session
+from app.core.audit import audit_writer
+from app.database import Base, get_connection, get_session
 from app.main import app
 
 
@@ -41,12 +42,20 @@ async def async_session(engine):
 
 
 @pytest.fixture
-async def client(async_session):
+async def client(engine, async_session):
     async def override_get_session():
         return async_session
 
+    async def override_get_connection():
+        async with engine.connect() as conn:
+            yield conn
+
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_connection] = override_get_connection
+    audit_writer.start(sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
+
+    await audit_writer.stop()
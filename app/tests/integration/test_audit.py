@@ -0,0 +1,83 @@
+import asyncio
+from typing import override
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.audit import AuditWriter, history_entries
+from app.core.logger import logger
+from app.models.producer import ProducerHistory
+
+FAILED_ATTEMPTS = 1
+
+
+@pytest.mark.anyio
+async def test_audit_writer_retries_failed_batch(engine):
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    calls = 0
+
+    def flaky_session_maker():
+        nonlocal calls
+        calls += 1
+        if calls <= FAILED_ATTEMPTS:
+            raise OperationalError("INSERT", {}, Exception("connection lost"))
+        return session_maker()
+
+    writer = AuditWriter(max_queue_size=10, batch_size=10, retry_delay=0)
+    writer.start(flaky_session_maker)
+    await writer.record(history_entries(1, "delete", "auditor"))
+    assert await writer.flush()
+    await writer.stop()
+
+    async with session_maker() as session:
+        history = (await session.execute(select(ProducerHistory))).scalars().all()
+    assert calls == FAILED_ATTEMPTS + 1
+    assert [(h.producer_id, h.action, h.changed_by) for h in history] == [
+        (1, "delete", "auditor")
+    ]
+
+
+@pytest.mark.anyio
+async def test_audit_flush_times_out_while_writes_are_stuck(engine):
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    release = asyncio.Event()
+
+    class StuckWriter(AuditWriter):
+        async def _write(self, batch):
+            await release.wait()
+            await super()._write(batch)
+
+    writer = StuckWriter(max_queue_size=10, batch_size=10, flush_timeout=0.05)
+    writer.start(session_maker)
+    await writer.record(history_entries(1, "delete"))
+    assert not await writer.flush()
+
+    release.set()
+    assert await writer.flush()
+    await writer.stop()
+
+
+@pytest.mark.anyio
+async def test_audit_stop_logs_entries_it_could_not_write():
+    class StuckWriter(AuditWriter):
+        @override
+        async def _write(self, batch):
+            await asyncio.Event().wait()
+
+    messages = []
+    handler_id = logger.add(messages.append, level="ERROR")
+    # batch_size=1: uma entrada fica em gravação e a outra permanece na fila.
+    writer = StuckWriter(max_queue_size=10, batch_size=1, shutdown_timeout=0.05)
+    writer.start(session_maker=None)
+    changes = {"city": ("Campinas", "Jaboticabal"), "name": ("Antigo", "Novo")}
+    await writer.record(history_entries(1, "update", "auditor", changes))
+    await writer.stop()
+    logger.remove(handler_id)
+
+    assert len(messages) == 1
+    assert "2 unwritten entries" in messages[0]
+    assert "'new_value': 'Jaboticabal'" in messages[0]
+    assert "'new_value': 'Novo'" in messages[0]
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, select_encoding
+from app.main import app
+
+MINIMUM_SIZE = 100
+LARGE_BODY = "produtor," * 200
+OPTIONAL_ENCODINGS = [("br", "brotli"), ("zstd", "zstandard")]
+
+compressed_app = FastAPI()
+compressed_app.add_middleware(
+    CompressionMiddleware, minimum_size=MINIMUM_SIZE, excluded_paths=("/excluded",)
+)
+
+
+@compressed_app.get("/large")
+def large() -> dict:
+    return {"data": LARGE_BODY}
+
+
+@compressed_app.get("/excluded")
+def excluded() -> dict:
+    return {"data": LARGE_BODY}
+
+
+@compressed_app.get("/stream")
+def stream() -> StreamingResponse:
+    return StreamingResponse(iter([LARGE_BODY.encode()] * 3), media_type="text/csv")
+
+
+def decompress(encoding: str, body: bytes) -> bytes:
+    if encoding == "br":
+        return pytest.importorskip("brotli").decompress(body)
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+
+
+def get_raw(path: str, encoding: str):
+    """Faz a requisição e devolve o corpo ainda comprimido, sem decodificação do httpx."""
+    client = TestClient(compressed_app)
+    with client.stream("GET", path, headers={"Accept-Encoding": encoding}) as response:
+        return response.headers, b"".join(response.iter_raw())
+
+
+def test_select_encoding() -> None:
+    supported = ["zstd", "br", "gzip"]
+    assert select_encoding("gzip, br", supported) == "br"
+    assert select_encoding("gzip;q=1.0, br;q=0.5", supported) == "gzip"
+    assert select_encoding("br;q=0, gzip", ["br", "gzip"]) == "gzip"
+    assert select_encoding("*", supported) == "zstd"
+    assert select_encoding("identity", supported) is None
+
+
+def test_large_response_is_gzipped() -> None:
+    client = TestClient(compressed_app)
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == {"data": LARGE_BODY}
+
+
+def test_streaming_response_is_gzipped() -> None:
+    client = TestClient(compressed_app)
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == LARGE_BODY * 3
+
+
+@pytest.mark.parametrize(("encoding", "module"), OPTIONAL_ENCODINGS)
+def test_large_response_round_trips_with_optional_encodings(encoding, module) -> None:
+    pytest.importorskip(module)
+    headers, body = get_raw("/large", encoding)
+    assert headers["content-encoding"] == encoding
+    assert int(headers["content-length"]) == len(body)
+    assert json.loads(decompress(encoding, body)) == {"data": LARGE_BODY}
+
+
+@pytest.mark.parametrize(("encoding", "module"), OPTIONAL_ENCODINGS)
+def test_streaming_response_round_trips_with_optional_encodings(encoding, module) -> None:
+    pytest.importorskip(module)
+    headers, body = get_raw("/stream", encoding)
+    assert headers["content-encoding"] == encoding
+    assert "content-length" not in headers
+    assert decompress(encoding, body) == (LARGE_BODY * 3).encode()
+
+
+def test_excluded_and_small_responses_are_not_compressed() -> None:
+    client = TestClient(compressed_app)
+    response = client.get("/excluded", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+    response = TestClient(app).get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"status": "healthy"}
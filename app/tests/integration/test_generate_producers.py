@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+
+from app.schemas.producer import ProducerCreate, ProducerResponse
+from scripts.generate_producers import CHUNK_SIZE, cnpj, cpf, generate
+
+COUNT = CHUNK_SIZE + 500
+
+
+def test_documents_have_valid_check_digits() -> None:
+    assert cpf(111444777) == "11144477735"
+    assert cnpj(11222333) == "11222333000181"
+
+
+def test_generated_producers_are_valid_unique_and_reproducible() -> None:
+    rows = list(generate(COUNT, seed=7))
+
+    assert len(rows) == COUNT
+    assert len({row["cpf_cnpj"] for row in rows}) == COUNT
+    assert rows == list(generate(COUNT, seed=7, workers=2))
+    assert rows != list(generate(COUNT, seed=8))
+    for row in rows[:1000]:
+        ProducerCreate(**row)
+
+
+def test_generated_producers_round_trip_as_responses() -> None:
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for producer_id, row in enumerate(generate(100, seed=7), start=1):
+        # is_active fica com o default do banco (true), como nas linhas carregadas por COPY.
+        assert "is_active" not in row
+        response = ProducerResponse.model_validate({
+            **row,
+            "id": producer_id,
+            "created_at": created_at,
+        })
+        assert response.is_active is True
+        assert response.total_area_hectares == ProducerCreate(**row).total_area_hectares
@@ -8,3 +8,14 @@ def test_health_check() -> None:
     client = TestClient(app)
     response = client.get("/health")
     assert response.status_code == status.HTTP_200_OK
+
+
+def test_openapi_documents_sparse_field_responses() -> None:
+    spec = TestClient(app).get("/openapi.json").json()
+    schema = spec["paths"]["/api/v1/producers/{producer_id}"]["get"]["responses"]["200"]
+    refs = [s["$ref"] for s in schema["content"]["application/json"]["schema"]["anyOf"]]
+    assert refs == [
+        "#/components/schemas/ProducerResponse",
+        "#/components/schemas/ProducerPartialResponse",
+    ]
+    assert spec["components"]["schemas"]["ProducerPartialResponse"]["required"] == ["id"]
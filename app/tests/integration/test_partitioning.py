@@ -0,0 +1,142 @@
+import json
+
+import pytest
+from fastapi import status
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.crud.producer import PRODUCER_BY_ID, list_producers_query
+
+
+def producer_payload(cpf_cnpj: str, state: str) -> dict:
+    return {
+        "name": f"Produtor {state}",
+        "cpf_cnpj": cpf_cnpj,
+        "farm_name": "Fazenda Partição",
+        "city": "Cidade",
+        "state": state,
+        "total_area_hectares": "100,0 ha",
+        "arable_area_hectares": "80,0 ha",
+        "vegetation_area_hectares": "20,0 ha",
+    }
+
+
+def compile_sql(query) -> str:
+    return str(
+        query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+async def explain(async_session, query) -> str:
+    result = await async_session.execute(text(f"EXPLAIN {compile_sql(query)}"))
+    return "\n".join(row[0] for row in result)
+
+
+async def scanned_partitions(async_session, query) -> set:
+    """Partições efetivamente lidas, segundo o EXPLAIN ANALYZE.
+
+    A poda feita em tempo de execução não aparece no EXPLAIN simples; as partições
+    descartadas ficam com zero execuções (ou somem do plano) no EXPLAIN ANALYZE.
+    """
+    result = await async_session.execute(
+        text(f"EXPLAIN (ANALYZE, FORMAT JSON) {compile_sql(query)}")
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    nodes, scanned = [plan[0]["Plan"]], set()
+    while nodes:
+        node = nodes.pop()
+        relation = node.get("Relation Name", "")
+        if relation.startswith("producers_") and node["Actual Loops"] > 0:
+            scanned.add(relation)
+        nodes.extend(node.get("Plans", []))
+    return scanned
+
+
+@pytest.mark.anyio
+async def test_list_by_state_prunes_partitions(client, async_session):
+    for cpf_cnpj, state in [("55566677788", "SP"), ("66677788899", "MG")]:
+        response = await client.post(
+            "/api/v1/producers/", json=producer_payload(cpf_cnpj, state)
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+    plan = await explain(async_session, list_producers_query(state="SP"))
+    assert "producers_sp" in plan
+    assert "producers_mg" not in plan
+    assert "producers_default" not in plan
+
+    response = await client.get("/api/v1/producers/?state=mg")
+    assert response.status_code == status.HTTP_200_OK
+    assert [p["state"] for p in response.json()["producers"]] == ["MG"]
+
+
+@pytest.mark.anyio
+async def test_cpf_cnpj_is_unique_across_partitions(client):
+    response = await client.post(
+        "/api/v1/producers/", json=producer_payload("77788899900", "SP")
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = await client.post(
+        "/api/v1/producers/", json=producer_payload("77788899900", "BA")
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.anyio
+async def test_update_state_moves_producer_between_partitions(client, async_session):
+    response = await client.post(
+        "/api/v1/producers/", json=producer_payload("88899900011", "SP")
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    producer_id = response.json()["id"]
+
+    response = await client.put(f"/api/v1/producers/{producer_id}", json={"state": "GO"})
+    assert response.status_code == status.HTTP_200_OK
+
+    result = await async_session.execute(
+        text("SELECT tableoid::regclass::text FROM producers WHERE id = :id"),
+        {"id": producer_id},
+    )
+    assert result.scalar_one() == "producers_go"
+
+
+@pytest.mark.anyio
+async def test_get_by_id_reads_only_the_producer_partition(client, async_session):
+    producer_ids = []
+    for cpf_cnpj, state in [("99900011122", "SP"), ("00011122233", "MG")]:
+        response = await client.post(
+            "/api/v1/producers/", json=producer_payload(cpf_cnpj, state)
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        producer_ids.append(response.json()["id"])
+
+    query = PRODUCER_BY_ID.params(producer_id=producer_ids[1])
+    assert await scanned_partitions(async_session, query) == {"producers_mg"}
+
+    response = await client.get(f"/api/v1/producers/{producer_ids[1]}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["state"] == "MG"
+
+
+@pytest.mark.anyio
+async def test_id_is_unique_across_partitions(client, async_session):
+    response = await client.post(
+        "/api/v1/producers/", json=producer_payload("11122233344", "SP")
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    producer_id = response.json()["id"]
+
+    with pytest.raises(IntegrityError):
+        await async_session.execute(
+            text(
+                "INSERT INTO producers (id, cpf_cnpj, name, farm_name, city, state, "
+                "total_area_hectares, arable_area_hectares, vegetation_area_hectares) "
+                "VALUES (:id, '22233344455', 'Outro', 'Fazenda', 'Cidade', 'BA', 10, 5, 5)"
+            ),
+            {"id": producer_id},
+        )
+    await async_session.rollback()
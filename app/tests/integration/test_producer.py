@@ -1,5 +1,8 @@
 import pytest
 from fastapi import status
+from sqlalchemy import text
+
+from app.schemas.producer import ProducerCreate, format_hectares
 
 MAX_ITEMS_PER_PAGE = 3
 NOT_FOUND_ID = 9999
@@ -140,3 +143,138 @@ async def test_list_producers_pagination_limits(client):
 
     data = response.json()
     assert len(data["producers"]) <= LIMIT
+
+
+@pytest.mark.anyio
+async def test_batch_get_producers(client):
+    producer_ids = []
+    for i in range(3):
+        payload_local = {**payload, "cpf_cnpj": f"{i + 100:011d}", "name": f"Produtor {i}"}
+        response = await client.post("/api/v1/producers/", json=payload_local)
+        assert response.status_code == status.HTTP_201_CREATED
+        producer_ids.append(response.json()["id"])
+
+    response = await client.post(
+        "/api/v1/producers/batch-get", json={"ids": [*producer_ids, NOT_FOUND_ID]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [p["id"] for p in data["producers"]] == producer_ids
+    assert data["missing_ids"] == [NOT_FOUND_ID]
+
+    response = await client.post(
+        "/api/v1/producers/batch-get?fields=state", json={"ids": producer_ids[:2]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["producers"] == [
+        {"id": producer_id, "state": "SP"} for producer_id in producer_ids[:2]
+    ]
+
+
+@pytest.mark.anyio
+async def test_get_producer_with_fields(client):
+    create_response = await client.post("/api/v1/producers/", json=payload)
+    assert create_response.status_code == status.HTTP_201_CREATED
+    producer_id = create_response.json()["id"]
+
+    response = await client.get(
+        f"/api/v1/producers/{producer_id}?fields=name,total_area_hectares"
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "id": producer_id,
+        "name": payload["name"],
+        "total_area_hectares": "100,5 ha",
+    }
+
+    list_response = await client.get("/api/v1/producers/?fields=state")
+    assert list_response.status_code == status.HTTP_200_OK
+    assert list_response.json()["producers"] == [{"id": producer_id, "state": "SP"}]
+
+
+@pytest.mark.anyio
+async def test_get_producer_loaded_without_is_active(client, async_session):
+    # Mesmo formato das linhas carregadas por COPY, que não informam is_active.
+    result = await async_session.execute(
+        text(
+            "INSERT INTO producers (cpf_cnpj, name, farm_name, city, state, "
+            "total_area_hectares, arable_area_hectares, vegetation_area_hectares) "
+            "VALUES ('66677788899', 'Carga', 'Fazenda', 'Cidade', 'SP', 10, 5, 5) "
+            "RETURNING id"
+        )
+    )
+    producer_id = result.scalar_one()
+    await async_session.commit()
+
+    response = await client.get(f"/api/v1/producers/{producer_id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["is_active"] is True
+
+
+@pytest.mark.anyio
+async def test_get_producer_with_invalid_fields(client):
+    response = await client.get("/api/v1/producers/?fields=name,password")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "password" in response.json()["detail"]
+
+
+@pytest.mark.anyio
+async def test_create_producer_with_exact_hectares(client):
+    payload_local = {
+        **payload,
+        "cpf_cnpj": "33344455566",
+        "total_area_hectares": "0,3 ha",
+        "arable_area_hectares": "0,1 ha",
+        "vegetation_area_hectares": "0,2 ha",
+    }
+    response = await client.post("/api/v1/producers/", json=payload_local)
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()
+    assert data["total_area_hectares"] == "0,3 ha"
+    assert data["arable_area_hectares"] == "0,1 ha"
+    assert data["vegetation_area_hectares"] == "0,2 ha"
+
+
+def test_negative_zero_hectares_are_normalized():
+    producer = ProducerCreate(**{**payload, "vegetation_area_hectares": "-0 ha"})
+    assert not producer.vegetation_area_hectares.is_signed()
+    assert format_hectares(producer.vegetation_area_hectares) == "0,0 ha"
+
+
+@pytest.mark.anyio
+async def test_create_producer_with_out_of_range_hectares(client):
+    for total in ("1e30 ha", "123456789 ha"):
+        payload_local = {**payload, "cpf_cnpj": "55566677788", "total_area_hectares": total}
+        response = await client.post("/api/v1/producers/", json=payload_local)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.anyio
+async def test_producer_history(client):
+    create_response = await client.post(
+        "/api/v1/producers/", json={**payload, "cpf_cnpj": "44455566677"}
+    )
+    assert create_response.status_code == status.HTTP_201_CREATED
+    producer_id = create_response.json()["id"]
+
+    update_response = await client.put(
+        f"/api/v1/producers/{producer_id}",
+        json={"name": payload["name"], "city": "Campinas", "arable_area_hectares": "70,0 ha"},
+        headers={"X-User": "auditor"},
+    )
+    assert update_response.status_code == status.HTTP_200_OK
+    delete_response = await client.delete(f"/api/v1/producers/{producer_id}")
+    assert delete_response.status_code == status.HTTP_200_OK
+
+    response = await client.get(f"/api/v1/producers/{producer_id}/history")
+    assert response.status_code == status.HTTP_200_OK
+    history = response.json()
+    assert [(h["action"], h["field"]) for h in history] == [
+        ("update", "city"),
+        ("update", "arable_area_hectares"),
+        ("delete", None),
+    ]
+    assert history[0]["old_value"] == payload["city"]
+    assert history[0]["new_value"] == "Campinas"
+    assert history[0]["changed_by"] == "auditor"
+    assert (history[1]["old_value"], history[1]["new_value"]) == ("80,0 ha", "70,0 ha")
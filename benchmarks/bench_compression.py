@@ -0,0 +1,85 @@
+"""Custo de CPU x bytes economizados na compressão de respostas `ProducerList`.
+
+Uso:
+    uv run --extra compression python -m benchmarks.bench_compression
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timezone
+
+from app.core.compression import DEFAULT_LEVELS, available_compressors
+from app.schemas.producer import ProducerList, ProducerResponse
+
+STATES = ["SP", "MG", "PR", "RS", "GO", "MT", "MS", "BA", "SC", "TO"]
+CITIES = ["Ribeirão Preto", "Uberlândia", "Cascavel", "Passo Fundo", "Rio Verde", "Sorriso"]
+CROPS = ["Soja", "Milho", "Café", "Cana-de-açúcar", "Algodão", "Feijão", "Trigo"]
+LEVELS = {
+    "gzip": [1, DEFAULT_LEVELS["gzip"], 9],
+    "br": [1, DEFAULT_LEVELS["br"], 11],
+    "zstd": [1, DEFAULT_LEVELS["zstd"], 19],
+}
+
+
+def build_payload(size: int, seed: int = 42) -> bytes:
+    rng = random.Random(seed)
+    producers = []
+    for i in range(size):
+        total = round(rng.uniform(10, 5000), 2)
+        arable = round(total * rng.uniform(0.3, 0.8), 2)
+        producers.append(
+            ProducerResponse(
+                id=i + 1,
+                cpf_cnpj=f"{rng.randrange(10**10, 10**11):011d}",
+                name=f"Produtor {rng.randrange(10**6)}",
+                farm_name=f"Fazenda {rng.choice(['Boa Vista', 'Santa Rita', 'São José'])}",
+                city=rng.choice(CITIES),
+                state=rng.choice(STATES),
+                total_area_hectares=total,
+                arable_area_hectares=arable,
+                vegetation_area_hectares=round((total - arable) * rng.uniform(0.5, 1), 2),
+                planted_crops=", ".join(rng.sample(CROPS, rng.randint(1, 3))),
+                created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            )
+        )
+    return (
+        ProducerList(producers=producers, total=size, page=0, size=size)
+        .model_dump_json()
+        .encode()
+    )
+
+
+def compress(compressor_class, level: int, body: bytes) -> bytes:
+    compressor = compressor_class(level)
+    return compressor.compress(body) + compressor.finish()
+
+
+def run(sizes, repeat: int) -> None:
+    compressors = available_compressors()
+    print(
+        f"{'itens':>6} {'codec':>5} {'nível':>5} {'bytes':>10} "
+        f"{'razão':>7} {'ms/op':>8} {'MB/s':>8}"
+    )
+    for size in sizes:
+        body = build_payload(size)
+        print(f"{size:>6} {'-':>5} {'-':>5} {len(body):>10} {1:>7.2f} {0:>8.3f} {'-':>8}")
+        for encoding, compressor_class in compressors.items():
+            for level in LEVELS[encoding]:
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    compressed = compress(compressor_class, level, body)
+                elapsed = (time.perf_counter() - start) / repeat
+                print(
+                    f"{size:>6} {encoding:>5} {level:>5} {len(compressed):>10} "
+                    f"{len(body) / len(compressed):>7.2f} {elapsed * 1000:>8.3f} "
+                    f"{len(body) / elapsed / 1e6:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
@@ -0,0 +1,105 @@
+"""Latência e alocações do GET por ID: caminho ORM x caminho Core.
+
+Usa o DATABASE_URL configurado e produtores já existentes (ex: carregados com
+`scripts.generate_producers --copy`). Por padrão as leituras percorrem uma amostra
+aleatória de IDs, espalhada pelas partições, em vez de repetir sempre a mesma linha.
+
+Uso:
+    uv run python -m benchmarks.bench_read_producer --iterations 5000
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import statistics
+import time
+import tracemalloc
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.logger import logger
+from app.crud import producer as crud
+from app.models.producer import ProducerDocument
+from app.schemas.producer import ProducerResponse, producer_json
+
+CHECKED_SAMPLES = 50
+
+
+async def read_orm(session_maker, producer_id: int) -> str:
+    async with session_maker() as session:
+        db_producer = await crud.get_producer(session, producer_id)
+        return ProducerResponse.model_validate(db_producer).model_dump_json()
+
+
+async def read_core(engine, producer_id: int) -> str:
+    async with engine.connect() as conn:
+        row = await crud.get_producer_row(conn, producer_id)
+        return producer_json(row)
+
+
+async def measure(name: str, read, iterations: int) -> None:
+    for _ in range(100):
+        await read()
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await read()
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    await read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    print(
+        f"{name:>5} | média {statistics.mean(latencies) * 1e6:8.1f} µs"
+        f" | p50 {latencies[len(latencies) // 2] * 1e6:8.1f} µs"
+        f" | p99 {latencies[int(len(latencies) * 0.99)] * 1e6:8.1f} µs"
+        f" | pico alocado {peak / 1024:7.1f} KiB"
+    )
+
+
+async def sample_ids(engine, size: int) -> list:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(ProducerDocument.producer_id).order_by(func.random()).limit(size)
+        )
+        return result.scalars().all()
+
+
+async def run(database_url: str, producer_id: int, iterations: int, sample: int) -> None:
+    logger.remove()
+    engine = create_async_engine(database_url)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    producer_ids = [producer_id] if producer_id else await sample_ids(engine, sample)
+    if not producer_ids:
+        raise SystemExit("Nenhum produtor encontrado; carregue dados antes de medir.")
+
+    for checked_id in producer_ids[:CHECKED_SAMPLES]:
+        orm_body = await read_orm(session_maker, checked_id)
+        core_body = await read_core(engine, checked_id)
+        assert json.loads(orm_body) == json.loads(core_body), (
+            f"respostas diferentes para o produtor {checked_id}"
+        )
+
+    orm_ids, core_ids = itertools.cycle(producer_ids), itertools.cycle(producer_ids)
+    await measure("orm", lambda: read_orm(session_maker, next(orm_ids)), iterations)
+    await measure("core", lambda: read_core(engine, next(core_ids)), iterations)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    from app.core.settings import settings  # noqa: PLC0415 - exige variáveis de ambiente
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--producer-id", type=int, help="mede sempre o mesmo produtor")
+    parser.add_argument("--sample", type=int, default=1000, help="IDs aleatórios a percorrer")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.database_url, args.producer_id, args.iterations, args.sample))
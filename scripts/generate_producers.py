@@ -0,0 +1,248 @@
+"""Gera produtores sintéticos realistas para testes de escala.
+
+Os dados são determinísticos para uma mesma `--seed`, independente do número de
+workers: cada bloco de `CHUNK_SIZE` linhas usa o seu próprio gerador aleatório.
+
+Uso:
+    uv run python -m scripts.generate_producers --count 1000000 --format csv > producers.csv
+    uv run python -m scripts.generate_producers --count 1000000 --format ndjson -o p.ndjson
+    uv run python -m scripts.generate_producers --count 5000000 --copy --workers 8
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from functools import partial
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import psycopg
+from sqlalchemy.engine import make_url
+
+CHUNK_SIZE = 50_000
+CNPJ_SHARE = 0.15
+CPF_SPACE = 10**9
+CNPJ_SPACE = 10**8
+# Multiplicadores coprimos com 10: i -> (i * m + offset) % espaço é uma bijeção,
+# então os documentos nunca se repetem enquanto count < CNPJ_SPACE.
+CPF_MULTIPLIER = 387_420_489
+CNPJ_MULTIPLIER = 48_828_127
+MAX_COUNT = CNPJ_SPACE
+
+COLUMNS = (
+    "cpf_cnpj",
+    "name",
+    "farm_name",
+    "city",
+    "state",
+    "total_area_hectares",
+    "arable_area_hectares",
+    "vegetation_area_hectares",
+    "planted_crops",
+)
+
+# Peso aproximado de cada UF pelo número de estabelecimentos agropecuários
+# (Censo Agropecuário 2017, em milhares).
+STATE_WEIGHTS = {
+    "BA": 762, "MG": 607, "CE": 394, "RS": 365, "PR": 305, "PE": 282, "PA": 281,
+    "PI": 245, "MA": 219, "SP": 189, "SC": 183, "PB": 163, "GO": 152, "MT": 118,
+    "ES": 108, "AL": 98, "SE": 93, "RO": 91, "AM": 81, "MS": 71, "RJ": 65,
+    "RN": 63, "TO": 63, "AC": 37, "RR": 16, "AP": 8, "DF": 5,
+}  # fmt: skip
+
+CITIES = {
+    "AC": ["Rio Branco", "Cruzeiro do Sul", "Sena Madureira", "Tarauacá"],
+    "AL": ["Arapiraca", "Palmeira dos Índios", "Penedo", "Coruripe"],
+    "AM": ["Manacapuru", "Itacoatiara", "Parintins", "Humaitá"],
+    "AP": ["Macapá", "Santana", "Tartarugalzinho", "Porto Grande"],
+    "BA": ["Barreiras", "Luís Eduardo Magalhães", "Vitória da Conquista", "Juazeiro"],
+    "CE": ["Quixadá", "Crato", "Iguatu", "Limoeiro do Norte"],
+    "DF": ["Brasília", "Planaltina", "Brazlândia", "Paranoá"],
+    "ES": ["Linhares", "Colatina", "Cachoeiro de Itapemirim", "São Mateus"],
+    "GO": ["Rio Verde", "Jataí", "Cristalina", "Mineiros"],
+    "MA": ["Balsas", "Imperatriz", "Bacabal", "Chapadinha"],
+    "MG": ["Uberlândia", "Unaí", "Patos de Minas", "Paracatu", "Varginha"],
+    "MS": ["Dourados", "Maracaju", "Ponta Porã", "Chapadão do Sul"],
+    "MT": ["Sorriso", "Sinop", "Lucas do Rio Verde", "Rondonópolis", "Sapezal"],
+    "PA": ["Paragominas", "Santarém", "Marabá", "Altamira"],
+    "PB": ["Campina Grande", "Sousa", "Patos", "Guarabira"],
+    "PE": ["Petrolina", "Garanhuns", "Caruaru", "Serra Talhada"],
+    "PI": ["Uruçuí", "Bom Jesus", "Picos", "Floriano"],
+    "PR": ["Cascavel", "Toledo", "Guarapuava", "Londrina", "Ponta Grossa"],
+    "RJ": ["Campos dos Goytacazes", "Nova Friburgo", "Itaperuna", "Valença"],
+    "RN": ["Mossoró", "Caicó", "Açu", "Apodi"],
+    "RO": ["Vilhena", "Ji-Paraná", "Ariquemes", "Cacoal"],
+    "RR": ["Boa Vista", "Rorainópolis", "Mucajaí", "Alto Alegre"],
+    "RS": ["Passo Fundo", "Cruz Alta", "Santa Rosa", "Ijuí", "Uruguaiana"],
+    "SC": ["Chapecó", "Concórdia", "Lages", "Videira"],
+    "SE": ["Itabaiana", "Lagarto", "Estância", "Simão Dias"],
+    "SP": ["Ribeirão Preto", "Barretos", "Jaboticabal", "Presidente Prudente"],
+    "TO": ["Palmas", "Araguaína", "Gurupi", "Porto Nacional"],
+}
+
+CROPS = ["Soja", "Milho", "Café", "Cana-de-açúcar", "Algodão", "Feijão", "Arroz", "Trigo"]
+CROP_WEIGHTS = [30, 25, 10, 10, 6, 8, 6, 5]
+FIRST_NAMES = [
+    "José", "Maria", "João", "Ana", "Antônio", "Francisca", "Carlos", "Paulo",
+    "Adriana", "Lucas", "Juliana", "Pedro", "Márcia", "Luiz", "Fernanda", "Rafael",
+]  # fmt: skip
+LAST_NAMES = [
+    "Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves",
+    "Pereira", "Lima", "Gomes", "Costa", "Ribeiro", "Martins", "Carvalho",
+]  # fmt: skip
+FARM_PREFIXES = ["Fazenda", "Sítio", "Chácara", "Estância"]
+FARM_NAMES = [
+    "Santa Rita", "São José", "Boa Vista", "Bela Vista", "Três Irmãos", "Água Limpa",
+    "Santa Maria", "Primavera", "Esperança", "Monte Alegre", "Recanto", "Paraíso",
+]  # fmt: skip
+COMPANY_SUFFIXES = ["Agropecuária", "Agrícola", "Agronegócios"]
+
+STATES = list(STATE_WEIGHTS)
+STATE_CUM_WEIGHTS = list(accumulate(STATE_WEIGHTS.values()))
+CROP_CUM_WEIGHTS = list(accumulate(CROP_WEIGHTS))
+M2_PER_HECTARE = 10_000
+
+
+def _check_digit(digits: Sequence[int], weights: Sequence[int]) -> int:
+    remainder = sum(d * w for d, w in zip(digits, weights)) % 11
+    return 0 if remainder < 2 else 11 - remainder  # noqa: PLR2004
+
+
+def cpf(base: int) -> str:
+    """CPF válido a partir de uma base de 9 dígitos."""
+    digits = [int(c) for c in f"{base:09d}"]
+    digits.append(_check_digit(digits, range(10, 1, -1)))
+    digits.append(_check_digit(digits, range(11, 1, -1)))
+    return "".join(map(str, digits))
+
+
+def cnpj(base: int) -> str:
+    """CNPJ válido (matriz 0001) a partir de uma base de 8 dígitos."""
+    digits = [int(c) for c in f"{base:08d}0001"]
+    digits.append(_check_digit(digits, [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]))
+    digits.append(_check_digit(digits, [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]))
+    return "".join(map(str, digits))
+
+
+def _hectares(square_meters: int) -> str:
+    return str(Decimal(square_meters) / M2_PER_HECTARE)
+
+
+def generate_producer(index: int, rng: random.Random, offset: int) -> Dict[str, str]:
+    state = rng.choices(STATES, cum_weights=STATE_CUM_WEIGHTS)[0]
+    last_name = rng.choice(LAST_NAMES)
+
+    if rng.random() < CNPJ_SHARE:
+        document = cnpj((index * CNPJ_MULTIPLIER + offset) % CNPJ_SPACE)
+        name = f"{last_name} {rng.choice(COMPANY_SUFFIXES)} Ltda"
+    else:
+        document = cpf((index * CPF_MULTIPLIER + offset) % CPF_SPACE)
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {last_name}"
+
+    # Distribuição log-normal: muitas propriedades pequenas e poucas muito grandes.
+    # As áreas são calculadas em m² inteiros, então agricultável + vegetação nunca
+    # excede o total.
+    total = max(M2_PER_HECTARE // 2, int(rng.lognormvariate(3.0, 1.4) * M2_PER_HECTARE))
+    arable = int(total * rng.uniform(0.2, 0.85))
+    vegetation = int((total - arable) * rng.uniform(0.3, 1.0))
+    crops = set(rng.choices(CROPS, cum_weights=CROP_CUM_WEIGHTS, k=rng.randint(1, 3)))
+
+    return {
+        "cpf_cnpj": document,
+        "name": name,
+        "farm_name": f"{rng.choice(FARM_PREFIXES)} {rng.choice(FARM_NAMES)}",
+        "city": rng.choice(CITIES[state]),
+        "state": state,
+        "total_area_hectares": _hectares(total),
+        "arable_area_hectares": _hectares(arable),
+        "vegetation_area_hectares": _hectares(vegetation),
+        "planted_crops": ", ".join(sorted(crops)),
+    }
+
+
+def generate_chunk(seed: int, count: int, chunk: int) -> List[Dict[str, str]]:
+    rng = random.Random(f"{seed}-{chunk}")
+    offset = random.Random(seed).randrange(CNPJ_SPACE)
+    start = chunk * CHUNK_SIZE
+    stop = min(start + CHUNK_SIZE, count)
+    return [generate_producer(index, rng, offset) for index in range(start, stop)]
+
+
+def generate(count: int, seed: int, workers: int = 1) -> Iterator[Dict[str, str]]:
+    """Gera `count` produtores em ordem, usando `workers` processos."""
+    chunks = range((count + CHUNK_SIZE - 1) // CHUNK_SIZE)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from generate_chunk(seed, count, chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for rows in executor.map(partial(generate_chunk, seed, count), chunks):
+            yield from rows
+
+
+def copy_chunk(conninfo: str, seed: int, count: int, chunk: int) -> int:
+    rows = generate_chunk(seed, count, chunk)
+    with psycopg.connect(conninfo) as conn, conn.cursor() as cursor:
+        with cursor.copy(f"COPY producers ({', '.join(COLUMNS)}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row([row[column] for column in COLUMNS])
+    return len(rows)
+
+
+def copy_to_database(count: int, seed: int, workers: int, database_url: str) -> None:
+    """Carrega os produtores direto no Postgres com COPY, um bloco por conexão."""
+    url = make_url(database_url).set(drivername="postgresql")
+    conninfo = url.render_as_string(hide_password=False)
+    chunks = range((count + CHUNK_SIZE - 1) // CHUNK_SIZE)
+    loaded = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for rows in executor.map(partial(copy_chunk, conninfo, seed, count), chunks):
+            loaded += rows
+            print(f"{loaded}/{count} producers loaded", file=sys.stderr)
+
+
+def write_rows(rows: Iterator[Dict[str, str]], output_format: str, output) -> None:
+    if output_format == "csv":
+        writer = csv.DictWriter(output, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        for row in rows:
+            output.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("-o", "--output", help="arquivo de saída (padrão: stdout)")
+    parser.add_argument(
+        "--copy", action="store_true", help="carrega no Postgres (DATABASE_URL) com COPY"
+    )
+    args = parser.parse_args(argv)
+
+    if not 0 < args.count <= MAX_COUNT:
+        parser.error(f"--count deve estar entre 1 e {MAX_COUNT}")
+
+    if args.copy:
+        from app.core.settings import settings  # noqa: PLC0415 - exige variáveis de ambiente
+
+        copy_to_database(args.count, args.seed, args.workers, settings.DATABASE_URL)
+        return
+
+    rows = generate(args.count, args.seed, args.workers)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as output:
+            write_rows(rows, args.format, output)
+    else:
+        write_rows(rows, args.format, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()